@@ -1,26 +1,54 @@
 """Sports Scores Dashboard - Streamlit App"""
 
 import streamlit as st
-from streamlit_js import st_js
-from espn_api import (fetch_mlb_scores, fetch_nba_scores, fetch_nhl_scores, fetch_nfl_scores,
-                      fetch_premier_league_scores, parse_game_data, fetch_nhl_news, fetch_nba_news,
-                      fetch_nfl_news, fetch_premier_league_news, fetch_mlb_news)
-from nhl_stats import (fetch_nhl_points_leaders, fetch_nhl_goals_leaders, fetch_nhl_assists_leaders,
-                       fetch_nhl_plus_minus_leaders, fetch_nhl_gaa_leaders, fetch_nhl_pim_leaders,
-                       get_nhl_season_type)
-from nba_stats import (fetch_nba_ppg_leaders, fetch_nba_assists_leaders, fetch_nba_fgp_leaders,
-                       fetch_nba_rebounds_leaders, fetch_nba_ftp_leaders, fetch_nba_3pt_leaders,
-                       fetch_nba_steals_leaders, get_nba_season_type)
-from nfl_stats import (fetch_nfl_passing_leaders, fetch_nfl_rushing_leaders, fetch_nfl_receiving_leaders,
-                       fetch_nfl_tackles_leaders, fetch_nfl_sacks_leaders, get_nfl_season_type)
-from pl_stats import (fetch_pl_goal_leaders, fetch_pl_assist_leaders, get_pl_season_type)
-from mlb_stats import (fetch_mlb_batting_avg_leaders, fetch_mlb_home_runs_leaders, fetch_mlb_rbi_leaders, 
-                       fetch_mlb_era_leaders, get_mlb_season_type)
-from formatters import format_game_time
+from page_loader import load_page_data, load_scoreboards, load_section, page_snapshot
+from poller import start_poller
+from score_cards import get_overview_cards, get_score_cards
+
+# Leader tables per sport: label -> table key in the league's stats module
+STATS_TABLES = {
+    "MLB": {
+        "Batting Average": 'batting_avg',
+        "Home Runs": 'home_runs',
+        "Runs Batted In (RBI)": 'rbi',
+        "Earned Run Average (ERA)": 'era',
+    },
+    "NBA": {
+        "Points Per Game (PPG)": 'ppg',
+        "Assists Per Game (APG)": 'assists',
+        "Field Goal Percentage (FG%)": 'fgp',
+        "Rebounds Per Game (RPG)": 'rebounds',
+        "Free Throw Percentage (FT%)": 'ftp',
+        "3-Point Percentage (3P%)": '3pt',
+        "Steals Per Game (SPG)": 'steals',
+    },
+    "NFL": {
+        "Passing Yards": 'passing',
+        "Rushing Yards": 'rushing',
+        "Receiving Yards": 'receiving',
+        "Total Tackles": 'tackles',
+        "Total Sacks": 'sacks',
+    },
+    "NHL": {
+        "Points": 'points',
+        "Goals": 'goals',
+        "Assists": 'assists',
+        "Plus/Minus": 'plus_minus',
+        "Goals Against Average (GAA)": 'gaa',
+        "Penalty Minutes (PIM)": 'pim',
+    },
+    "Premier League": {
+        "Goal": 'goals',
+        "Assist": 'assists',
+    },
+}
 
 # Page config
 st.set_page_config(page_title="Sports Scores", page_icon="🏆", layout="wide")
 
+# Keep every sport's data warm in the background (no-op after the first run)
+start_poller()
+
 # Sidebar
 st.sidebar.header("Settings")
 
@@ -36,19 +64,12 @@ sport = st.sidebar.selectbox(
 )
 st.session_state.selected_sport = sport
 
-# Get the user's timezone using JavaScript's Intl API
-user_tz = st_js("""
-  try {
-    return Intl.DateTimeFormat().resolvedOptions().timeZone;
-  } catch (e) {
-    return null;
-  }
-""",
-    key="user-timezone",
-)
+# The browser reports the user's timezone when the session connects; unlike a
+# JavaScript component this needs no extra round trip and doesn't pull in pandas
+user_tz = st.context.timezone
 
 # Timezone selection with default to user's timezone
-default_timezone = user_tz[0] if user_tz else "America/New_York"
+default_timezone = user_tz or "America/New_York"
 
 timezone_options = ["America/New_York", "America/Chicago", "America/Denver", 
                     "America/Phoenix", "America/Los_Angeles", "America/Anchorage", 
@@ -67,8 +88,12 @@ selected_tz = st.sidebar.selectbox("Timezone", timezone_options, index=default_i
 
 st.sidebar.caption(f"Detected Timezone: {default_timezone}")
 
+# Only the scores section refreshes itself; news and stats stay as rendered
+refresh_options = {"Off": None, "10 seconds": 10, "30 seconds": 30, "1 minute": 60}
+auto_refresh = st.sidebar.selectbox("Auto-refresh scores", list(refresh_options), index=2)
+
 if st.sidebar.button("🔄 Refresh"):
-    st.rerun()  # Forces the whole app to re-run, fetching fresh data
+    st.rerun()  # Forces the whole app to re-run with the latest stored data
 
 if sport == "Home":
     st.title("Sports Dashboard")
@@ -88,302 +113,107 @@ if sport == "Home":
             if st.button(f"{icon} {name}", width="stretch"):
                 st.session_state.selected_sport = name
                 st.rerun()
+
+    sport_icons = {name: icon for icon, name in sports}
+
+    @st.fragment(run_every=refresh_options[auto_refresh])
+    def render_overview():
+        """Every league's games in one slate; the five scoreboards load in parallel."""
+        st.divider()
+        st.subheader("🏆 Live & Upcoming")
+
+        snapshots = {name: snapshot for name, snapshot in load_scoreboards().items() if snapshot is not None}
+        slate = get_overview_cards(snapshots, selected_tz)
+        if not slate:
+            st.write("No games scheduled.")
+
+        card_elements = {'info': st.info, 'success': st.success, 'write': st.write}
+        for name, (element, text) in slate:
+            card_elements[element](f"{sport_icons[name]} **{name}** · {text}")
+
+        missing = [name for _, name in sports if name not in snapshots]
+        if missing:
+            st.warning(f"Unable to load {', '.join(missing)} scores")
+
+    render_overview()
     st.stop()
 
 st.title(f"{sport}")
 
-raw_data = None
+# The scoreboard comes from the background-refreshed store
+load_page_data(sport)
+scores = page_snapshot(sport, 'scores')
 sport_code = ""
 sport_icon = ""
 
 if sport == "MLB":
-    raw_data = fetch_mlb_scores()
     sport_code = "mlb"
     sport_icon = "⚾️"
 elif sport == "NBA":
-    raw_data = fetch_nba_scores()
     sport_code = "nba"
     sport_icon = "🏀"
 elif sport == "NFL":
-    raw_data = fetch_nfl_scores()
     sport_code = "nfl"
     sport_icon = "🏈"
 elif sport == "NHL":
-    raw_data = fetch_nhl_scores()
     sport_code = "nhl"
     sport_icon = "🏒"
 elif sport == "Premier League":
-    raw_data = fetch_premier_league_scores()
     sport_code = "eng.1"
     sport_icon = "⚽"
 
-if raw_data:
+@st.fragment(run_every=refresh_options[auto_refresh])
+def render_scores():
+    """Scores section; on each timer tick only this fragment re-runs."""
+    # The poller keeps the stored snapshot current, so a tick is a store lookup
+    # plus a render-cache hit unless the scoreboard version changed
+    snapshot = page_snapshot(sport, 'scores') or scores
+
     st.subheader(f"{sport_icon} {sport} Scores")
-    for game in raw_data.get('events', []):
-        game_data = parse_game_data(game, sport_code)
-
-        if game_data['state'] == 'pre':
-            game_time = format_game_time(game_data['date'], selected_tz)
-            broadcast_text = f"\n\nWatch: {game_data['broadcast']}" if game_data.get('broadcast') else ""
-            if sport_code != 'eng.1':
-                st.info(f"{game_data['away_team']} @ {game_data['home_team']} - {game_time}\n\n"
-                        f"Odds: {game_data['odds']}\n\n{broadcast_text}")
-            else:
-                st.info(f"{game_data['home_team']} vs {game_data['away_team']} - {game_time}\n\n{broadcast_text}")
-
-        elif game_data['state'] == 'in':
-            broadcast_text = f"\n\nWatch: {game_data['broadcast']}" if game_data.get('broadcast') else ""
-            if sport_code != 'eng.1':
-                st.success(f"{game_data['away_team']} {game_data['away_score']} @ "
-                    f"{game_data['home_team']} {game_data['home_score']}\n\n"
-                    f"{game_data['game_status']}\n\n{broadcast_text}")
-            else:
-                st.success(f"{game_data['home_team']} {game_data['home_score']} vs "
-                    f"{game_data['away_score']} {game_data['away_team']}\n\n"
-                    f"{game_data['game_status']}\n\n{broadcast_text}")
-
-        else:
-            if sport_code != 'eng.1':
-                st.write(f"{game_data['away_team']} {game_data['away_score']} @ "
-                     f"{game_data['home_team']} {game_data['home_score']} - {game_data['game_status']}")
-            else:
-                st.write(f"{game_data['home_team']} {game_data['home_score']} - "
-                         f"{game_data['away_score']} {game_data['away_team']} - {game_data['game_status']}")
 
-    # News section
+    # Cards are formatted once per scoreboard version and timezone, for every session
+    card_elements = {'info': st.info, 'success': st.success, 'write': st.write}
+    for element, text in get_score_cards(sport, snapshot, sport_code, selected_tz):
+        card_elements[element](text)
+
+if scores is not None:
+    render_scores()
+
+    # News and stats are fetched, and their tables built, only once their section is opened
     st.divider()
-    st.subheader(f"📰 {sport} News")
-    st.caption("News from ESPN")
-
-    # Fetch news based on sport
-    if sport == "MLB":
-        news = fetch_mlb_news()
-    elif sport == "NBA":
-        news = fetch_nba_news()
-    elif sport == "NFL":
-        news = fetch_nfl_news()
-    elif sport == "NHL":
-        news = fetch_nhl_news()
-    elif sport == "Premier League":
-        news = fetch_premier_league_news()
-
-    if news:
-        for i, article in enumerate(news):  # Show top 5 articles
-            with st.expander(f"{article['headline']}", expanded=(i == 0)):
-                if article['description']:
-                    st.write(article['description'])
-                st.markdown(f"[Read full article]({article['url']})")
-    else:
-        st.warning(f"Unable to load {sport} news")
-
-    # Stats Section
-    if sport == "MLB":
-        st.divider()
-        st.subheader("📊 MLB Statistics")
-        st.caption(get_mlb_season_type())
-
-        batting_avg_df = fetch_mlb_batting_avg_leaders()
-        if not batting_avg_df.empty:
-            st.subheader("Batting Average Leaders")
-            st.dataframe(batting_avg_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load MLB Batting Average leaders")
-
-        home_runs_df = fetch_mlb_home_runs_leaders()
-        if not home_runs_df.empty:
-            st.subheader("Home Runs Leaders")
-            st.dataframe(home_runs_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load MLB Home Runs leaders")
-
-        rbi_df = fetch_mlb_rbi_leaders()
-        if not rbi_df.empty:
-            st.subheader("Runs Batted In (RBI) Leaders")
-            st.dataframe(rbi_df, width='content')
-        else:
-            st.warning("Unable to load MLB RBI leaders")
-
-        era_df = fetch_mlb_era_leaders()
-        if not era_df.empty:
-            st.subheader("Earned Run Average (ERA) Leaders")
-            st.dataframe(era_df, width='content')
-        else:
-            st.warning("Unable to load MLB ERA leaders")
-
-    elif sport == "NHL":
-        st.divider()
-        st.subheader("📊 NHL Statistics")
-        st.caption(get_nhl_season_type())
-
-        points_df = fetch_nhl_points_leaders()
-        if not points_df.empty:
-            st.subheader("Points Leaders")
-            st.dataframe(points_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NHL Points leaders")
-
-        goals_df = fetch_nhl_goals_leaders()
-        if not goals_df.empty:
-            st.subheader("Goals Leaders")
-            st.dataframe(goals_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NHL Goals leaders")
-
-        assists_df = fetch_nhl_assists_leaders()
-        if not assists_df.empty:
-            st.subheader("Assists Leaders")
-            st.dataframe(assists_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NHL Assists leaders")
-
-        plus_minus_df = fetch_nhl_plus_minus_leaders()
-        if not plus_minus_df.empty:
-            st.subheader("Plus/Minus Leaders")
-            st.dataframe(plus_minus_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NHL Plus/Minus leaders")
-
-        gaa_df = fetch_nhl_gaa_leaders()
-        if not gaa_df.empty:
-            st.subheader("Goals Against Average (GAA) Leaders")
-            st.dataframe(gaa_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NHL GAA leaders")
-
-        pim_df = fetch_nhl_pim_leaders()
-        if not pim_df.empty:
-            st.subheader("Penalty Minutes (PIM) Leaders")
-            st.dataframe(pim_df, width='content')
-        else:
-            st.warning("Unable to load NHL PIM leaders")
-
-    elif sport == "NBA":
-        st.divider()
-        st.subheader("📊 NBA Statistics")
-        st.caption(get_nba_season_type())
-
-        ppg_df = fetch_nba_ppg_leaders()
-        if not ppg_df.empty:
-            st.subheader("Points Per Game (PPG) Leaders")
-            st.dataframe(ppg_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NBA PPG leaders")
-
-        assists_df = fetch_nba_assists_leaders()
-        if not assists_df.empty:
-            st.subheader("Assists Per Game (APG) Leaders")
-            st.dataframe(assists_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NBA APG leaders")
-
-        fgp_df = fetch_nba_fgp_leaders()
-        if not fgp_df.empty:
-            st.subheader("Field Goal Percentage (FG%) Leaders")
-            st.dataframe(fgp_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NBA FG% leaders")
-
-        rebounds_df = fetch_nba_rebounds_leaders()
-        if not rebounds_df.empty:
-            st.subheader("Rebounds Per Game (RPG) Leaders")
-            st.dataframe(rebounds_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NBA RPG leaders")
-
-        ftp_df = fetch_nba_ftp_leaders()
-        if not ftp_df.empty:
-            st.subheader("Free Throw Percentage (FT%) Leaders")
-            st.dataframe(ftp_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NBA FT% leaders")
-
-        threept_df = fetch_nba_3pt_leaders()
-        if not threept_df.empty:
-            st.subheader("3-Point Percentage (3P%) Leaders")
-            st.dataframe(threept_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NBA 3P% leaders")
-
-        steals_df = fetch_nba_steals_leaders()
-        if not steals_df.empty:
-            st.subheader("Steals Per Game (SPG) Leaders")
-            st.dataframe(steals_df, width='content')
-        else:
-            st.warning("Unable to load NBA SPG leaders")
-
-    elif sport == "NFL":
-        st.divider()
-        st.subheader("📊 NFL Statistics")
-        st.caption(get_nfl_season_type())
-
-        passing_df = fetch_nfl_passing_leaders()
-        if not passing_df.empty:
-            st.subheader("Passing Yards Leaders")
-            st.dataframe(passing_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NFL Passing leaders")
-
-        rushing_df = fetch_nfl_rushing_leaders()
-        if not rushing_df.empty:
-            st.subheader("Rushing Yards Leaders")
-            st.dataframe(rushing_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NFL Rushing leaders")
-
-        receiving_df = fetch_nfl_receiving_leaders()
-        if not receiving_df.empty:
-            st.subheader("Receiving Yards Leaders")
-            st.dataframe(receiving_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NFL Receiving leaders")
-
-        tackles_df = fetch_nfl_tackles_leaders()
-        if not tackles_df.empty:
-            st.subheader("Total Tackles Leaders")
-            st.dataframe(tackles_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load NFL Tackles leaders")
-
-        sacks_df = fetch_nfl_sacks_leaders()
-        if not sacks_df.empty:
-            st.subheader("Total Sacks Leaders")
-            st.dataframe(sacks_df, width='content')
-        else:
-            st.warning("Unable to load NFL Sacks leaders")
-            
-    elif sport == "Premier League":
-        st.divider()
-        st.subheader("📊 Premier League Statistics")
-        st.caption(get_pl_season_type())
-
-        goal_df = fetch_pl_goal_leaders()
-        if not goal_df.empty:
-            st.subheader("Goal Leaders")
-            st.dataframe(goal_df, width='content')
-            st.divider()
-        else:
-            st.warning("Unable to load Premier League Goal leaders or the data is not available")
-
-        assist_df = fetch_pl_assist_leaders()
-        if not assist_df.empty:
-            st.subheader("Assist Leaders")
-            st.dataframe(assist_df, width='content')
-        else:
-            st.warning("Unable to load Premier League Assist leaders or the data is not available")
\ No newline at end of file
+
+    news_section = st.expander(f"📰 {sport} News", key=f"news-{sport}", on_change="rerun")
+    if news_section.open:
+        with news_section:
+            st.caption("News from ESPN")
+
+            news = load_section(sport, 'news')
+
+            if news:
+                for article in news:  # Show top 5 articles
+                    st.markdown(f"**{article['headline']}**")
+                    if article['description']:
+                        st.write(article['description'])
+                    st.markdown(f"[Read full article]({article['url']})")
+            else:
+                st.warning(f"Unable to load {sport} news")
+
+    stats_section = st.expander(f"📊 {sport} Statistics", key=f"stats-{sport}", on_change="rerun")
+    if stats_section.open:
+        with stats_section:
+            st.caption(load_section(sport, 'season_type'))
+
+            # pandas and the league's stats module load with the first opened table
+            from leaders import get_leaders
+
+            # Only the selected table is built
+            tables = STATS_TABLES[sport]
+            table = st.segmented_control("Leaders", list(tables), default=next(iter(tables)),
+                                         key=f"stats-table-{sport}")
+            if table:
+                leaders_df = get_leaders(sport, tables[table])
+                if not leaders_df.empty:
+                    st.subheader(f"{table} Leaders")
+                    st.dataframe(leaders_df, width='content')
+                else:
+                    st.warning(f"Unable to load {sport} {table} leaders")
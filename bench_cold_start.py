@@ -0,0 +1,75 @@
+"""
+Measure cold-start and first-paint time of a page in fresh Python processes.
+
+Each run starts a new interpreter, imports Streamlit's test runner and runs
+app.py once (first paint: the whole script has produced its elements) and
+then again (a warm rerun in the same process). ESPN is called for real.
+
+Usage:
+    python bench_cold_start.py                # Home page
+    python bench_cold_start.py NBA            # any sidebar page
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+RUNS = 5
+
+# Modules worth knowing about when they load on the first paint
+HEAVY_MODULES = ("pandas", "numpy", "pytz", "requests", "leaders")
+
+_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+
+at = AppTest.from_file({app!r}, default_timeout=60)
+at.session_state.selected_sport = {page!r}
+at.run()
+first_paint = time.perf_counter()
+at.run()
+rerun = time.perf_counter()
+
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'first_paint_ms': (first_paint - imported) * 1000,
+    'rerun_ms': (rerun - first_paint) * 1000,
+    'loaded': [name for name in {heavy!r} if name in sys.modules],
+    'exception': bool(at.exception),
+}}))
+"""
+
+
+def _run_once(page):
+    code = _CHILD.format(app=_APP, page=page, heavy=HEAVY_MODULES)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(_APP))
+    wall_ms = (time.perf_counter() - start) * 1000
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "no output")
+    return wall_ms, json.loads(lines[-1])
+
+
+def main(page):
+    print(f"{'run':<6}{'process':>12}{'import':>12}{'first paint':>14}{'rerun':>12}  loaded on first paint")
+    for run in range(1, RUNS + 1):
+        try:
+            wall_ms, timing = _run_once(page)
+        except Exception as e:
+            print(f"{run:<6}failed: {e}")
+            continue
+        note = " (script raised)" if timing['exception'] else ""
+        print(f"{run:<6}{wall_ms:>9.0f} ms{timing['import_ms']:>9.0f} ms{timing['first_paint_ms']:>11.0f} ms"
+              f"{timing['rerun_ms']:>9.0f} ms  {', '.join(timing['loaded']) or '-'}{note}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "Home")
@@ -0,0 +1,79 @@
+"""
+Benchmark JSON decode time per ESPN endpoint for each available decoder.
+
+Usage:
+    python bench_decode.py                 # fetch every endpoint live
+    python bench_decode.py saved.json ...  # time previously saved bodies
+"""
+
+import json
+import sys
+import time
+
+import http_client
+
+ENDPOINTS = {
+    "MLB scoreboard": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard",
+    "NBA scoreboard": "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard",
+    "NFL scoreboard": "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard",
+    "NHL scoreboard": "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
+    "Premier League scoreboard": "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard",
+    "NBA news": "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/news",
+    "MLB leaders": "https://site.api.espn.com/apis/site/v3/sports/baseball/mlb/leaders",
+    "NBA leaders": "https://site.api.espn.com/apis/site/v3/sports/basketball/nba/leaders",
+    "NFL leaders": "https://site.api.espn.com/apis/site/v3/sports/football/nfl/leaders",
+    "NHL leaders": "https://site.api.espn.com/apis/site/v3/sports/hockey/nhl/leaders",
+    "Premier League statistics": "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/statistics",
+}
+
+REPEAT = 50
+
+
+def _decoders():
+    decoders = {"json (stdlib)": json.loads}
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        decoders["msgspec"] = msgspec.json.decode
+    except ImportError:
+        pass
+    return decoders
+
+
+def _bodies(paths):
+    if paths:
+        for path in paths:
+            with open(path, 'rb') as f:
+                yield path, f.read()
+        return
+
+    for name, url in ENDPOINTS.items():
+        try:
+            response = http_client.get(url)
+            response.raise_for_status()
+            yield name, response.content
+        except Exception as e:
+            print(f"Skipping {name}: {e}")
+
+
+def main(paths):
+    decoders = _decoders()
+    print(f"http_client decodes with: {http_client.JSON_DECODER}\n")
+    print(f"{'payload':<28}{'KB':>8}" + "".join(f"{name:>16}" for name in decoders))
+
+    for name, body in _bodies(paths):
+        timings = []
+        for decode in decoders.values():
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                decode(body)
+            timings.append((time.perf_counter() - start) / REPEAT * 1000)
+        print(f"{name:<28}{len(body) / 1024:>8.0f}" + "".join(f"{ms:>13.2f} ms" for ms in timings))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,442 @@
+"""Process-wide TTL cache shared by the ESPN data fetchers."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from cache_backends import (FAILURE_BACKOFF, LEASE_POLL, LEASE_SECONDS, PEER_WAIT, InProcessBackend,
+                            open_cache_backend)
+
+# Seconds a cached payload stays fresh
+LIVE_SCOREBOARD_TTL = 10     # any game in progress
+SCOREBOARD_TTL = 60          # only pre/post games on the board
+NEWS_TTL = 300
+LEADERS_TTL = 3 * 60 * 60    # also expired early when a game goes final
+
+# Seconds past expiry that a value may still be served while it refreshes
+MAX_STALE = 60 * 60
+
+# Upper bound on the estimated size of everything in shared_cache
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+_MISSING = object()
+
+
+def estimate_size(value: Any, _seen: set = None) -> int:
+    """Approximate the deep size in bytes of a cached value."""
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    # DataFrames report their own deep usage
+    if hasattr(value, 'memory_usage'):
+        return int(value.memory_usage(deep=True).sum())
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in value)
+    elif hasattr(value, '__slots__'):
+        size += sum(estimate_size(getattr(value, slot), seen) for slot in value.__slots__)
+    return size
+
+
+class _Call:
+    """One in-flight call that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into a single execution."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() unless a call for key is already running, then share its result.
+
+        Args:
+            key: Identity of the call (usually the upstream URL)
+            fn: Zero-argument function doing the actual work
+
+        Returns:
+            fn's result; callers that waited get the same object. If fn
+            raised, every waiting caller re-raises the same exception.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    Expired entries are kept for up to max_stale further seconds so
+    get_or_load can serve them while a background refresh runs. Least
+    recently used entries are evicted once there are more than max_entries
+    or their estimated total size passes max_bytes.
+
+    With a shared backend (see cache_backends), loaded values are written
+    through for other processes, a local copy is rechecked against the
+    backend every backend.recheck_interval seconds, and only the process
+    holding a key's lease runs its loader.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = MAX_CACHE_BYTES,
+                 max_stale: float = MAX_STALE, backend=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_stale = max_stale
+        self.backend = backend if backend is not None else InProcessBackend()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> (expires_at, stale_until, value, size, digest, loaded_here)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the fresh value for key, or default on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def _peek(self, key: Hashable) -> Any:
+        """Return the fresh value for key without touching counters or LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return _MISSING
+            return entry[2]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return whatever value is stored for key, even expired, without touching counters or LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None else entry[2]
+
+    def peek_loaded(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Like peek, but only for a value this process's own loader produced.
+
+        A value adopted from another process came from that process's request,
+        so this process's conditional-GET validators for key don't describe it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return default if entry is None or not entry[5] else entry[2]
+
+    def _get_stale(self, key: Hashable) -> Any:
+        """Return an expired value that is still within its stale window, without touching counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                return _MISSING
+            return entry[2]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, here and in the backend."""
+        digest = None
+        try:
+            digest = self.backend.set(key, value, ttl)
+        except Exception as e:
+            # Kept in this process only
+            print(f"Error sharing {key}: {e}")
+        self._store(key, value, ttl, digest, loaded_here=True)
+
+    def _store(self, key: Hashable, value: Any, ttl: float, digest: Optional[str],
+               loaded_here: bool) -> None:
+        """Store value locally, evicting LRU entries while over budget."""
+        size = estimate_size(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[3]
+
+            now = time.monotonic()
+            expires_at = now + ttl
+            self._entries[key] = (self._local_expiry(now, expires_at, digest), expires_at + self.max_stale,
+                                  value, size, digest, loaded_here)
+            self.bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop LRU entries while over budget; call with the lock held."""
+        # Never evict the most recent entry, even if it alone is over budget
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries
+                                          or self.bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted[3]
+
+    def add_size(self, key: Hashable, value: Any, size: int) -> None:
+        """
+        Count bytes added in place to a cached value (e.g., a table built on first use).
+
+        Ignored unless value is still the object cached under key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] is not value:
+                return
+            self._entries[key] = entry[:3] + (entry[3] + size,) + entry[4:]
+            self._entries.move_to_end(key)
+            self.bytes += size
+            self._evict()
+
+    def _local_expiry(self, now: float, expires_at: float, digest: Optional[str]) -> float:
+        """Shared entries are trusted locally for at most the backend's recheck interval."""
+        recheck = self.backend.recheck_interval
+        if digest is None or recheck is None:
+            return expires_at
+        return min(expires_at, now + recheck)
+
+    def expire(self, key: Hashable) -> None:
+        """Mark key stale now, in every process; get_or_load serves it once more while refreshing."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                now = time.monotonic()
+                self._entries[key] = (now, now + self.max_stale) + entry[2:]
+        try:
+            self.backend.expire(key)
+        except Exception as e:
+            print(f"Error expiring shared {key}: {e}")
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry[3]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.stale_hits = 0
+
+    def _adopt(self, key: Hashable) -> Tuple[Any, bool]:
+        """
+        Pick up key from the backend, or fall back to this process's stale copy.
+
+        Returns:
+            (value, fresh); value is _MISSING when nothing is within its stale window
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        digest = entry[4] if entry is not None else None
+
+        try:
+            shared = self.backend.get(key, digest)
+        except Exception as e:
+            print(f"Error reading shared {key}: {e}")
+            shared = None
+
+        if shared is not None:
+            remaining = shared.expires_at - time.time()
+            if remaining > -self.max_stale:
+                if shared.value is None:
+                    # Same content as our copy: only its expiry moves
+                    value = entry[2]
+                    with self._lock:
+                        if key in self._entries:
+                            now = time.monotonic()
+                            self._entries[key] = (self._local_expiry(now, now + remaining, digest),
+                                                  now + remaining + self.max_stale) + entry[2:]
+                else:
+                    value = shared.value
+                    self._store(key, value, remaining, shared.digest, loaded_here=False)
+                return value, remaining > 0
+
+        return self._get_stale(key), False
+
+    def _acquire(self, key: Hashable) -> bool:
+        try:
+            return self.backend.acquire(key)
+        except Exception as e:
+            # Refresh anyway rather than leave the key unrefreshed
+            print(f"Error taking lease for {key}: {e}")
+            return True
+
+    def _count(self, key: Hashable, counter: str) -> None:
+        """Record one get_or_load outcome ('hits', 'stale_hits' or 'misses') and mark key recently used."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def _backing_off(self, key: Hashable) -> bool:
+        try:
+            return self.backend.failed(key)
+        except Exception as e:
+            print(f"Error reading lease for {key}: {e}")
+            return False
+
+    def _await_peer(self, key: Hashable, wait: float) -> Tuple[Any, bool]:
+        """
+        Wait for the process holding key's lease to store a fresh value.
+
+        Returns:
+            (value, False) with the peer's fresh value, or with this process's
+            stale copy (None if it has none) once the peer's refresh fails or
+            wait seconds pass; (None, True) once this process holds the lease
+            itself (the peer released it or its lease ran out)
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            value, fresh = self._adopt(key)
+            if fresh:
+                return value, False
+            if self._backing_off(key) or time.monotonic() >= deadline:
+                return (None if value is _MISSING else value), False
+            if self._acquire(key):
+                return None, True
+            time.sleep(LEASE_POLL)
+
+    def _release(self, key: Hashable, loaded: bool) -> None:
+        """Give up key's lease; after a failed refresh, hold every process off for FAILURE_BACKOFF."""
+        try:
+            if loaded:
+                self.backend.release(key)
+            else:
+                self.backend.fail(key, FAILURE_BACKOFF)
+        except Exception as e:
+            print(f"Error releasing lease for {key}: {e}")
+
+    def _load(self, key: Hashable, loader: Callable[[], Any],
+              ttl: Union[float, Callable[[Any], float]], wait: float) -> Any:
+        def load():
+            # A caller that missed just as another load finished reuses it
+            value = self._peek(key)
+            if value is not _MISSING:
+                return value
+
+            # Only one process runs the loader; the others wait for its result
+            if not self._acquire(key):
+                value, acquired = self._await_peer(key, wait)
+                if not acquired:
+                    return value
+            loaded = False
+            try:
+                # A peer may have finished between our miss and taking the lease
+                value, fresh = self._adopt(key)
+                if fresh:
+                    loaded = True
+                    return value
+                value = loader()
+                if value is not None:
+                    self.set(key, value, ttl(value) if callable(ttl) else ttl)
+                    loaded = True
+                return value
+            finally:
+                self._release(key, loaded)
+
+        return self._flight.do(key, load)
+
+    def _revalidate(self, key: Hashable, loader: Callable[[], Any],
+                    ttl: Union[float, Callable[[Any], float]]) -> None:
+        """Refresh key on a background thread unless a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._load(key, loader, ttl, LEASE_SECONDS)
+            except Exception as e:
+                print(f"Error refreshing {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name="cache-revalidate", daemon=True).start()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any],
+                    ttl: Union[float, Callable[[Any], float]], allow_stale: bool = True) -> Any:
+        """
+        Return the cached value for key, calling loader() on a miss.
+
+        Args:
+            key: Cache key (usually the upstream URL)
+            loader: Zero-argument function that fetches the value
+            ttl: Seconds to keep the value, or a function of the value returning them
+            allow_stale: Serve an expired value while refreshing in the
+                background; False waits for the refresh instead
+
+        Returns:
+            The cached or freshly loaded value. With allow_stale, an expired
+            value still inside its stale window is returned immediately while
+            loader() runs in the background. None results are not cached, so
+            a failed fetch keeps the last good value and is retried on the
+            next call (with a shared backend, after FAILURE_BACKOFF). Concurrent
+            misses on the same key share a single loader() call; a caller
+            waiting on another process's refresh gets its own stale copy, or
+            None, if that refresh fails or takes longer than PEER_WAIT.
+        """
+        value = self._peek(key)
+        if value is not _MISSING:
+            self._count(key, 'hits')
+            return value
+
+        # Another process may have refreshed it already
+        value, fresh = self._adopt(key)
+        if fresh:
+            self._count(key, 'hits')
+            return value
+        if value is not _MISSING and allow_stale:
+            self._count(key, 'stale_hits')
+            self._revalidate(key, loader, ttl)
+            return value
+
+        self._count(key, 'misses')
+        return self._load(key, loader, ttl, PEER_WAIT)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters, entry count and estimated bytes held."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'stale_hits': self.stale_hits,
+                    'size': len(self._entries), 'bytes': self.bytes}
+
+
+# One cache per server process, shared by every Streamlit session and, through
+# the SQLite backend, by every server process on the host
+shared_cache = TTLCache(max_entries=128, max_bytes=MAX_CACHE_BYTES, backend=open_cache_backend())
@@ -0,0 +1,196 @@
+"""Backends that let every server process on a host share one cache."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Hashable, NamedTuple, Optional
+
+from snapshot_db import DB_PATH, connect, decode_value, encode_key, encode_value
+
+# Seconds a process may hold a key's refresh lease; longer than a slow fetch
+LEASE_SECONDS = 30
+
+# Seconds between a waiting process's checks for a peer's refreshed value
+LEASE_POLL = 0.1
+
+# Seconds a foreground caller waits for a peer's refresh before serving what it has
+PEER_WAIT = 5
+
+# Seconds no process refreshes a key after a refresh of it failed
+FAILURE_BACKOFF = 10
+
+# Lease owner recorded while a key is backing off after a failed refresh
+_FAILED = "failed"
+
+# Seconds a local copy of a shared entry is trusted before checking the backend again
+RECHECK_INTERVAL = 5
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        value TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cache_leases (
+        key TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+)
+
+
+class BackendEntry(NamedTuple):
+    """A shared entry; value is None when the caller already holds this digest."""
+    value: Any
+    expires_at: float   # wall-clock time.time()
+    digest: str
+
+
+class InProcessBackend:
+    """Stand-in backend for a single process: nothing is shared and every lease is granted."""
+
+    recheck_interval: Optional[float] = None
+
+    def get(self, key: Hashable, known_digest: Optional[str] = None) -> Optional[BackendEntry]:
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> Optional[str]:
+        return None
+
+    def expire(self, key: Hashable) -> None:
+        pass
+
+    def acquire(self, key: Hashable) -> bool:
+        return True
+
+    def release(self, key: Hashable) -> None:
+        pass
+
+    def fail(self, key: Hashable, backoff: float) -> None:
+        pass
+
+    def failed(self, key: Hashable) -> bool:
+        return False
+
+
+class SQLiteBackend:
+    """
+    Cache entries and refresh leases in a SQLite file shared by local processes.
+
+    Values are stored as JSON with a content digest, so a process that
+    already holds the same content can skip decoding it.
+    """
+
+    recheck_interval: Optional[float] = RECHECK_INTERVAL
+
+    def __init__(self, path: str):
+        self.path = path
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self._connection = connect(path)
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, known_digest: Optional[str] = None) -> Optional[BackendEntry]:
+        """
+        Read a shared entry.
+
+        Args:
+            key: Cache key
+            known_digest: Digest of the copy the caller holds; if it matches,
+                the value is not decoded
+
+        Returns:
+            The entry, fresh or expired, or None if no process has stored one
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT kind, value, digest, expires_at FROM cache_entries WHERE key = ?",
+                (encode_key(key),)).fetchone()
+        if row is None:
+            return None
+
+        kind, text, digest, expires_at = row
+        if digest == known_digest:
+            return BackendEntry(None, expires_at, digest)
+        return BackendEntry(decode_value(kind, text), expires_at, digest)
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> Optional[str]:
+        """Store value for every process; returns its digest."""
+        kind, text = encode_value(value)
+        digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, kind, value, digest, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (encode_key(key), kind, text, digest, time.time() + ttl))
+        return digest
+
+    def expire(self, key: Hashable) -> None:
+        """Mark the shared entry expired so every process refreshes it."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE cache_entries SET expires_at = MIN(expires_at, ?) WHERE key = ?",
+                (time.time(), encode_key(key)))
+
+    def acquire(self, key: Hashable) -> bool:
+        """
+        Take the refresh lease for key.
+
+        Returns:
+            True if this process now holds the lease (or already did), False
+            while another process holds an unexpired one
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE cache_leases.expires_at <= ? OR cache_leases.owner = excluded.owner",
+                (encode_key(key), self.owner, now + LEASE_SECONDS, now))
+        return cursor.rowcount == 1
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM cache_leases WHERE key = ? AND owner = ?", (encode_key(key), self.owner))
+
+    def fail(self, key: Hashable, backoff: float) -> None:
+        """
+        Release this process's lease after a failed refresh, leaving a marker.
+
+        Until backoff seconds pass no process can take the lease, and waiting
+        processes stop waiting instead of each retrying the fetch in turn.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE cache_leases SET owner = ?, expires_at = ? WHERE key = ? AND owner = ?",
+                (_FAILED, time.time() + backoff, encode_key(key), self.owner))
+
+    def failed(self, key: Hashable) -> bool:
+        """True while key is backing off after a failed refresh."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM cache_leases WHERE key = ? AND owner = ? AND expires_at > ?",
+                (encode_key(key), _FAILED, time.time())).fetchone()
+        return row is not None
+
+
+def open_cache_backend(path: str = DB_PATH):
+    """Open the shared backend, falling back to the in-process stand-in if it's off or unavailable."""
+    if not path:
+        return InProcessBackend()
+    try:
+        return SQLiteBackend(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error opening shared cache {path}: {e}")
+        return InProcessBackend()
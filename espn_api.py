@@ -1,67 +1,117 @@
 """ESPN API data fetching functions for various sports."""
 
-import requests
-from typing import Dict, List, Optional
-
-def fetch_mlb_scores() -> Optional[Dict]:
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+import http_client
+from cache import shared_cache, LIVE_SCOREBOARD_TTL, SCOREBOARD_TTL, NEWS_TTL
+from score_changes import publish_scoreboard
+
+
+@dataclass(frozen=True, slots=True)
+class GameRecord:
+    """One scoreboard event, normalized to the fields the app uses."""
+    id: str
+    state: str
+    description: str
+    period: int
+    game_status: str
+    clock: str
+    date: str
+    home_team: str
+    away_team: str
+    home_score: str
+    away_score: str
+    odds: Optional[str]
+    broadcast: Optional[str]
+    sport: str
+
+# Leaders (for the Premier League, statistics) URL of each league, kept here so
+# code that must not import pandas can refer to the cached leaders
+LEADERS_URLS = {
+    "MLB": "https://site.api.espn.com/apis/site/v3/sports/baseball/mlb/leaders",
+    "NBA": "https://site.api.espn.com/apis/site/v3/sports/basketball/nba/leaders",
+    "NFL": "https://site.api.espn.com/apis/site/v3/sports/football/nfl/leaders",
+    "NHL": "https://site.api.espn.com/apis/site/v3/sports/hockey/nhl/leaders",
+    "Premier League": "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/statistics",
+}
+
+def _scoreboard_ttl(games: Tuple[GameRecord, ...]) -> float:
+    """Keep scoreboards with live games fresh for only a few seconds."""
+    for game in games:
+        if game.state == 'in':
+            return LIVE_SCOREBOARD_TTL
+    return SCOREBOARD_TTL
+
+def _fetch_scoreboard(url: str, league: str, sport: str,
+                      allow_stale: bool = True) -> Optional[Tuple[GameRecord, ...]]:
+    """Fetch a scoreboard and parse it into GameRecords through the shared cache."""
+    def load():
+        try:
+            # The lease holder has already adopted the newest shared value, so this
+            # is the scoreboard every process last saw, not just this one
+            previous = shared_cache.peek(url)
+            games = http_client.get_json(url, transform=lambda data: parse_scoreboard(data, sport),
+                                         previous=shared_cache.peek_loaded(url))
+            # Keep the previous tuple when nothing changed so downstream versions don't move
+            return publish_scoreboard(league, previous, games)
+        except Exception as e:
+            print(f"Error fetching {league} scores: {e}")
+            return None
+
+    return shared_cache.get_or_load(url, load, ttl=_scoreboard_ttl, allow_stale=allow_stale)
+
+def _parse_news(data: Dict) -> List[Dict]:
+    """Normalize a news payload into the fields the app shows."""
+    news_list = []
+    for article in data['articles']:
+        news_list.append({
+            'headline': article['headline'],
+            'url': article['links']['web']['href'],
+            'description': article.get('description', ''),  # Some articles may not have this
+            'published': article.get('published', '')
+        })
+
+    return news_list
+
+def _fetch_news(url: str, league: str, allow_stale: bool = True) -> Optional[List[Dict]]:
+    """Fetch and normalize a news feed through the shared cache."""
+    def load():
+        try:
+            return http_client.get_json(url, transform=_parse_news, previous=shared_cache.peek_loaded(url))
+        except Exception as e:
+            print(f"Error fetching {league} news: {e}")
+            return None
+
+    return shared_cache.get_or_load(url, load, ttl=NEWS_TTL, allow_stale=allow_stale)
+
+def fetch_mlb_scores(allow_stale: bool = True) -> Optional[Tuple[GameRecord, ...]]:
     """Fetch current MLB scores and games."""
-    url = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching MLB scores: {e}")
-        return None
+    return _fetch_scoreboard("https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard",
+                             "MLB", "mlb", allow_stale)
 
-def fetch_nhl_scores() -> Optional[Dict]:
+def fetch_nhl_scores(allow_stale: bool = True) -> Optional[Tuple[GameRecord, ...]]:
     """Fetch current NHL scores and games."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching NHL scores: {e}")
-        return None
+    return _fetch_scoreboard("https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
+                             "NHL", "nhl", allow_stale)
 
-def fetch_nba_scores() -> Optional[Dict]:
+def fetch_nba_scores(allow_stale: bool = True) -> Optional[Tuple[GameRecord, ...]]:
     """Fetch current NBA scores and games."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching NBA scores: {e}")
-        return None
+    return _fetch_scoreboard("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard",
+                             "NBA", "nba", allow_stale)
 
-def fetch_nfl_scores() -> Optional[Dict]:
+def fetch_nfl_scores(allow_stale: bool = True) -> Optional[Tuple[GameRecord, ...]]:
     """Fetch current NFL scores and games."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching NFL scores: {e}")
-        return None
+    return _fetch_scoreboard("https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard",
+                             "NFL", "nfl", allow_stale)
 
-def fetch_premier_league_scores() -> Optional[Dict]:
+def fetch_premier_league_scores(allow_stale: bool = True) -> Optional[Tuple[GameRecord, ...]]:
     """Fetch current Premier League scores and games."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"Error fetching Premier League scores: {e}")
-        return None
-
-def get_broadcast_info(game: Dict, sport: str = "nhl") -> str:
-    """Extract all broadcast info from game data."""
-    competition = game['competitions'][0]
+    return _fetch_scoreboard("https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard",
+                             "Premier League", "eng.1", allow_stale)
 
+def _broadcast_text(competition: Dict) -> Optional[str]:
+    """Join every broadcast of a competition into one display line."""
     if 'broadcasts' not in competition or not competition['broadcasts']:
         return None
 
@@ -75,147 +125,69 @@ def get_broadcast_info(game: Dict, sport: str = "nhl") -> str:
 
     return " | ".join(broadcast_list) if broadcast_list else None
 
-def parse_game_data(game: Dict, sport: str = "nhl") -> Dict:
-    """
-    Parse ESPN API game data into a normalized format.
-    """
+def get_broadcast_info(game: Dict, sport: str = "nhl") -> str:
+    """Extract all broadcast info from game data."""
+    return _broadcast_text(game['competitions'][0])
+
+def _parse_game(game: Dict, sport: str) -> GameRecord:
     status = game['status']
+    status_type = status['type']
     competition = game['competitions'][0]
-
-    # Get broadcast info
-    broadcast = get_broadcast_info(game)
+    home, away = competition['competitors'][0], competition['competitors'][1]
 
     # Safely get odds (may not exist for all games)
     odds = None
     if 'odds' in competition and len(competition['odds']) > 0 and competition['odds'][0] is not None:
         odds = competition['odds'][0].get('details', 'N/A')
 
-    return {
-        'state': status['type']['state'],
-        'description': status['type']['description'],
-        'period': status.get('period', 0),
-        'game_status': status['type']['detail'],
-        'clock': status.get('displayClock', '0:00'),
-        'date': game['date'],
-        'home_team': competition['competitors'][0]['team']['displayName'],
-        'away_team': competition['competitors'][1]['team']['displayName'],
-        'home_score': competition['competitors'][0]['score'],
-        'away_score': competition['competitors'][1]['score'],
-        'odds': odds,
-        'broadcast': broadcast,
-        'sport': sport
-    }
-
-def fetch_mlb_news() -> Optional[Dict]:
+    return GameRecord(
+        id=game.get('id', ''),
+        state=status_type['state'],
+        description=status_type['description'],
+        period=status.get('period', 0),
+        game_status=status_type['detail'],
+        clock=status.get('displayClock', '0:00'),
+        date=game['date'],
+        home_team=home['team']['displayName'],
+        away_team=away['team']['displayName'],
+        home_score=home['score'],
+        away_score=away['score'],
+        odds=odds,
+        broadcast=_broadcast_text(competition),
+        sport=sport,
+    )
+
+def parse_scoreboard(raw: Dict, sport: str = "nhl") -> Tuple[GameRecord, ...]:
+    """Parse a whole ESPN scoreboard payload into GameRecords in one pass."""
+    return tuple(_parse_game(game, sport) for game in raw.get('events', []))
+
+def parse_game_data(game: Dict, sport: str = "nhl") -> Dict:
+    """
+    Parse ESPN API game data into a normalized format.
+    """
+    return asdict(_parse_game(game, sport))
+
+def fetch_mlb_news(allow_stale: bool = True) -> Optional[List[Dict]]:
     """Fetch latest MLB news articles."""
-    try:
-        url = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/news"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        news_list = []
-        for article in data['articles']:
-            news_list.append({
-                'headline': article['headline'],
-                'url': article['links']['web']['href'],
-                'description': article.get('description', ''),
-                'published': article.get('published', '')
-            })
-
-        return news_list
-
-    except Exception as e:
-        print(f"Error fetching MLB news: {e}")
-
-def fetch_nhl_news() -> Optional[List[Dict]]:
+    return _fetch_news("https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/news",
+                       "MLB", allow_stale)
+
+def fetch_nhl_news(allow_stale: bool = True) -> Optional[List[Dict]]:
     """Fetch latest NHL news articles."""
-    try:
-        url = "http://site.api.espn.com/apis/site/v2/sports/hockey/nhl/news"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        news_list = []
-        for article in data['articles']:
-            news_list.append({
-                'headline': article['headline'],
-                'url': article['links']['web']['href'],
-                'description': article.get('description', ''),  # Some articles may not have this
-                'published': article.get('published', '')
-            })
-
-        return news_list
-
-    except Exception as e:
-        print(f"Error fetching NHL news: {e}")
-        return None
+    return _fetch_news("https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/news",
+                       "NHL", allow_stale)
 
-def fetch_nba_news() -> Optional[List[Dict]]:
+def fetch_nba_news(allow_stale: bool = True) -> Optional[List[Dict]]:
     """Fetch latest NBA news articles."""
-    try:
-        url = "http://site.api.espn.com/apis/site/v2/sports/basketball/nba/news"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        news_list = []
-        for article in data['articles']:
-            news_list.append({
-                'headline': article['headline'],
-                'url': article['links']['web']['href'],
-                'description': article.get('description', ''),
-                'published': article.get('published', '')
-            })
-
-        return news_list
-
-    except Exception as e:
-        print(f"Error fetching NBA news: {e}")
-        return None
+    return _fetch_news("https://site.api.espn.com/apis/site/v2/sports/basketball/nba/news",
+                       "NBA", allow_stale)
 
-def fetch_nfl_news() -> Optional[List[Dict]]:
+def fetch_nfl_news(allow_stale: bool = True) -> Optional[List[Dict]]:
     """Fetch latest NFL news articles."""
-    try:
-        url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl/news"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        news_list = []
-        for article in data['articles']:
-            news_list.append({
-                'headline': article['headline'],
-                'url': article['links']['web']['href'],
-                'description': article.get('description', ''),
-                'published': article.get('published', '')
-            })
-
-        return news_list
-
-    except Exception as e:
-        print(f"Error fetching NFL news: {e}")
-        return None
-    
-def fetch_premier_league_news() -> Optional[List[Dict]]:
+    return _fetch_news("https://site.api.espn.com/apis/site/v2/sports/football/nfl/news",
+                       "NFL", allow_stale)
+
+def fetch_premier_league_news(allow_stale: bool = True) -> Optional[List[Dict]]:
     """Fetch latest Premier League news articles."""
-    try:
-        url = "http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/news"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        news_list = []
-        for article in data['articles']:
-            news_list.append({
-                'headline': article['headline'],
-                'url': article['links']['web']['href'],
-                'description': article.get('description', ''),
-                'published': article.get('published', '')
-            })
-
-        return news_list
-
-    except Exception as e:
-        print(f"Error fetching Premier League news: {e}")
-        return None
\ No newline at end of file
+    return _fetch_news("https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/news",
+                       "Premier League", allow_stale)
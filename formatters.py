@@ -1,24 +1,23 @@
 """Utility functions for formatting times and game data."""
 
-from datetime import datetime
-import pytz
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable, List
 
 
-def format_game_time(utc_time_string: str, timezone: str = "America/New_York") -> str:
-    """
-    Convert UTC game time to user's local timezone.
+@lru_cache(maxsize=64)
+def _get_timezone(timezone: str):
+    # Imported on first use to keep it off the cold-start path
+    import pytz
+    return pytz.timezone(timezone)
 
-    Args:
-        utc_time_string: ISO format UTC time from ESPN API
-        timezone: Timezone string (e.g., 'America/New_York')
 
-    Returns:
-        Formatted time string like "3:00 PM"
-    """
-    user_tz = pytz.timezone(timezone)
-    today = datetime.now(user_tz).date()
-    game_time_utc = datetime.fromisoformat(utc_time_string.replace('Z', '+00:00'))
-    game_time_local = game_time_utc.astimezone(user_tz)
+@lru_cache(maxsize=2048)
+def _parse_utc(utc_time_string: str) -> datetime:
+    return datetime.fromisoformat(utc_time_string.replace('Z', '+00:00'))
+
+
+def _format_local(game_time_local: datetime, today: date) -> str:
     game_date = game_time_local.date()
 
     # Platform-safe formatting
@@ -31,4 +30,43 @@ def format_game_time(utc_time_string: str, timezone: str = "America/New_York") -
     if game_date == today:
         return f"{display_hour}:{minute:02d} {am_pm}"
     else:
-        return f"{game_time_local.strftime('%b')} {game_time_local.day}, {display_hour}:{minute:02d} {am_pm}"
\ No newline at end of file
+        return f"{game_time_local.strftime('%b')} {game_time_local.day}, {display_hour}:{minute:02d} {am_pm}"
+
+
+def local_today(timezone: str = "America/New_York") -> date:
+    """Return today's date in the given timezone."""
+    return datetime.now(_get_timezone(timezone)).date()
+
+
+def format_game_times(utc_time_strings: Iterable[str], timezone: str = "America/New_York") -> List[str]:
+    """
+    Convert a batch of UTC game times to the user's local timezone.
+
+    The timezone and "today" are resolved once for the whole batch, and
+    parsed UTC datetimes are memoized by string across calls.
+
+    Args:
+        utc_time_strings: ISO format UTC times from ESPN API
+        timezone: Timezone string (e.g., 'America/New_York')
+
+    Returns:
+        Formatted time strings like "3:00 PM", in the same order
+    """
+    user_tz = _get_timezone(timezone)
+    today = local_today(timezone)
+    return [_format_local(_parse_utc(utc_time_string).astimezone(user_tz), today)
+            for utc_time_string in utc_time_strings]
+
+
+def format_game_time(utc_time_string: str, timezone: str = "America/New_York") -> str:
+    """
+    Convert UTC game time to user's local timezone.
+
+    Args:
+        utc_time_string: ISO format UTC time from ESPN API
+        timezone: Timezone string (e.g., 'America/New_York')
+
+    Returns:
+        Formatted time string like "3:00 PM"
+    """
+    return format_game_times([utc_time_string], timezone)[0]
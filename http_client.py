@@ -0,0 +1,207 @@
+"""Shared HTTP client used by every ESPN fetcher."""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Decode with orjson or msgspec when installed; both are several times faster
+# than the stdlib on large scoreboard and leaders bodies
+try:
+    import orjson
+    decode_json = orjson.loads
+    JSON_DECODER = "orjson"
+except ImportError:
+    try:
+        import msgspec
+        decode_json = msgspec.json.decode
+        JSON_DECODER = "msgspec"
+    except ImportError:
+        decode_json = json.loads
+        JSON_DECODER = "json"
+
+# (connect, read) timeouts in seconds so a hung socket can't stall a render
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Connection pool bounds: number of hosts kept, and keep-alive sockets per host
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Circuit breaker: open after this many consecutive failures per host, then
+# probe again after a backoff that doubles on every failed probe
+FAILURE_THRESHOLD = 3
+BASE_BACKOFF = 5
+MAX_BACKOFF = 5 * 60
+
+_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures for one host and blocks requests while open."""
+
+    def __init__(self):
+        self.failures = 0
+        self.backoff = BASE_BACKOFF
+        self.open_until = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        with self._lock:
+            if self.failures < FAILURE_THRESHOLD:
+                return True
+            # Open: let a single probe through once the backoff has elapsed
+            if self.probing or time.monotonic() < self.open_until:
+                return False
+            self.probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.backoff = BASE_BACKOFF
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.probing:
+                self.backoff = min(self.backoff * 2, MAX_BACKOFF)
+                self.probing = False
+            if self.failures >= FAILURE_THRESHOLD:
+                self.open_until = time.monotonic() + self.backoff
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _breaker_for(url: str) -> CircuitBreaker:
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+class _Validated(NamedTuple):
+    """Validators and body hash of the last 200 response for a URL; the result lives in the cache."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: bytes
+
+
+_validated: Dict[str, _Validated] = {}
+_validated_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# One keep-alive session per server process
+session = _build_session()
+
+
+def get(url: str, timeout=DEFAULT_TIMEOUT, **kwargs) -> requests.Response:
+    """
+    GET a URL over the shared pooled session.
+
+    Args:
+        url: Absolute URL to fetch
+        timeout: (connect, read) timeout in seconds
+
+    Returns:
+        The requests Response; callers still call raise_for_status()
+
+    Raises:
+        CircuitOpenError: the host failed repeatedly and is backing off
+        requests.RequestException: the request itself failed
+    """
+    breaker = _breaker_for(url)
+    if not breaker.allow():
+        raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}, skipping {url}")
+
+    try:
+        response = session.get(url, timeout=timeout, **kwargs)
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    # Server errors and throttling count against the host; 4xx are our fault
+    if response.status_code >= 500 or response.status_code == 429:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def get_json(url: str, transform: Optional[Callable[[Any], Any]] = None,
+             timeout=DEFAULT_TIMEOUT, previous: Any = None) -> Any:
+    """
+    GET a JSON URL, reusing the previous parsed result when it hasn't changed.
+
+    When the caller still holds the previous result, the last response's
+    ETag / Last-Modified are sent back as If-None-Match / If-Modified-Since.
+    On a 304, or a 200 whose body hashes the same as last time, previous is
+    returned as the same object without decoding or transforming anything.
+
+    Args:
+        url: Absolute URL to fetch
+        transform: Optional function applied to the decoded JSON
+        timeout: (connect, read) timeout in seconds
+        previous: The result this process's last request for url produced,
+            if the caller still has it (e.g., its expired cache entry). The
+            validators are kept per process, so a result another process
+            fetched must not be passed. None fetches in full
+
+    Returns:
+        transform(decoded JSON), or the decoded JSON when no transform is given
+
+    Raises:
+        requests.RequestException: the request failed or returned an error status
+        ValueError: the body is not valid JSON
+    """
+    validated = _validated.get(url) if previous is not None else None
+    headers = {}
+    if validated is not None:
+        if validated.etag:
+            headers['If-None-Match'] = validated.etag
+        if validated.last_modified:
+            headers['If-Modified-Since'] = validated.last_modified
+
+    response = get(url, timeout=timeout, headers=headers)
+    if response.status_code == 304 and validated is not None:
+        return previous
+    response.raise_for_status()
+
+    body_hash = hashlib.blake2b(response.content, digest_size=16).digest()
+    if validated is not None and validated.body_hash == body_hash:
+        result = previous
+    else:
+        data = decode_json(response.content)
+        result = transform(data) if transform else data
+
+    with _validated_lock:
+        _validated[url] = _Validated(response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                                     body_hash)
+    return result
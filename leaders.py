@@ -0,0 +1,270 @@
+"""Shared, expiring cache for the leaders payloads of every sport."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import http_client
+from cache import estimate_size, shared_cache, LEADERS_TTL
+from espn_api import LEADERS_URLS
+
+# Stats module for each league; importing it registers the league
+_STATS_MODULES = {
+    "MLB": "mlb_stats",
+    "NBA": "nba_stats",
+    "NFL": "nfl_stats",
+    "NHL": "nhl_stats",
+    "Premier League": "pl_stats",
+}
+
+# League name (as used by espn_api) -> (leaders URL, ingest function)
+_leagues: Dict[str, Tuple[str, Callable[[Dict], Any]]] = {}
+
+# League name -> table key -> function building that table from the cached payload
+_tables: Dict[str, Dict[str, Callable[[Dict], pd.DataFrame]]] = {}
+
+
+def index_categories(categories: List[Dict]) -> Dict[str, Dict]:
+    """Index leaders categories by name and by abbreviation for O(1) lookups."""
+    index = {}
+    for category in categories:
+        for key in (category.get('name'), category.get('abbreviation')):
+            if key:
+                index.setdefault(key, category)
+    return index
+
+def _project_category(category: Dict) -> Dict:
+    """Keep only the category and leader fields the tables read; drop the rest of the tree."""
+    return {
+        'name': category.get('name'),
+        'abbreviation': category.get('abbreviation'),
+        'leaders': [{
+            'value': leader.get('value'),
+            'displayValue': leader.get('displayValue'),
+            'athlete': {'displayName': leader['athlete']['displayName']},
+            'team': {'displayName': leader['team']['displayName']},
+        } for leader in category['leaders']],
+    }
+
+def parse_leaders(data: Dict) -> Dict:
+    """Project a v3 leaders payload to its categories, their name index and the season type."""
+    categories = [_project_category(category) for category in data['leaders']['categories']]
+    return {
+        'categories': categories,
+        'index': index_categories(categories),
+        'season_type': data['currentSeason']['type']['name'],
+        # Filled by leader_table as sections are opened
+        'tables': {},
+    }
+
+def leader_table(leaders: Dict, name: str, build: Callable[[Dict], pd.DataFrame],
+                 cache_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    Return one of a snapshot's leader tables, building it the first time it's asked for.
+
+    Tables are cached with the payload, so every session reads the same
+    DataFrames; callers must treat them as read-only.
+
+    Args:
+        leaders: Cached payload holding a 'tables' dict
+        name: Table key
+        build: Builds the table from the payload
+        cache_key: shared_cache key of the payload; a newly built table's
+            bytes are counted against it
+    """
+    tables = leaders['tables']
+    if name not in tables:
+        table = build(leaders)
+        if tables.setdefault(name, table) is table and cache_key is not None:
+            # The payload was sized when it was cached, before this table existed
+            shared_cache.add_size(cache_key, leaders, estimate_size(table))
+    return tables[name]
+
+def category_leaders(leaders: Dict, key: str, position: int) -> List[Dict]:
+    """
+    Return the leaders list of one category.
+
+    Args:
+        leaders: Parsed leaders payload from parse_leaders
+        key: Category name or abbreviation
+        position: Historical position of the category, used only if ESPN
+            doesn't publish the key
+
+    Returns:
+        The category's leaders, or [] if it can't be found
+    """
+    category = leaders['index'].get(key)
+    if category is None:
+        categories = leaders['categories']
+        if position >= len(categories):
+            return []
+        category = categories[position]
+    return category['leaders']
+
+def register_league(league: str, url: str, ingest: Callable[[Dict], Any] = parse_leaders,
+                    tables: Optional[Dict[str, Callable[[Dict], pd.DataFrame]]] = None) -> None:
+    """
+    Declare where a league's leaders come from and how they are ingested.
+
+    Args:
+        league: League name as used by espn_api (e.g., 'NBA', 'Premier League')
+        url: ESPN leaders/statistics URL
+        ingest: Function turning the decoded JSON into the cached value, a
+            dict holding an empty 'tables' dict
+        tables: Builders for the league's named tables; each runs once per
+            snapshot, the first time its table is requested
+    """
+    _leagues[league] = (url, ingest)
+    _tables[league] = tables or {}
+
+def fetch_leaders(league: str, allow_stale: bool = True) -> Optional[Any]:
+    """
+    Fetch a registered league's leaders payload through the shared cache.
+
+    Args:
+        league: League name as used by espn_api
+        allow_stale: Serve an expired payload while it refreshes in the background
+
+    Returns:
+        The ingested payload, or None if it could not be fetched
+    """
+    url, ingest = _leagues[league]
+
+    def load():
+        try:
+            leaders = http_client.get_json(url, transform=ingest, previous=shared_cache.peek_loaded(url))
+        except Exception as e:
+            print(f"Error fetching {league} leaders: {e}")
+            return None
+        return leaders
+
+    # With the SQLite backend the cached payload also survives restarts
+    return shared_cache.get_or_load(url, load, ttl=LEADERS_TTL, allow_stale=allow_stale)
+
+def invalidate_leaders(league: str) -> None:
+    """Expire a league's cached leaders; the next read refreshes them in the background."""
+    shared_cache.expire(LEADERS_URLS[league])
+
+def get_leaders(league: str, category: str) -> pd.DataFrame:
+    """
+    Return the ranked table for one category of a league.
+
+    Args:
+        league: League name (e.g., 'NBA', 'Premier League')
+        category: Table key used by the stats module (e.g., 'ppg'), or an ESPN
+            category name or abbreviation (e.g., 'pointsPerGame', 'BLK')
+
+    Returns:
+        The shared read-only table, or an empty DataFrame if the league's
+        leaders or the category are unavailable
+
+    Raises:
+        KeyError: league is not one of the supported leagues
+    """
+    if league not in _leagues:
+        importlib.import_module(_STATS_MODULES[league])
+
+    leaders = fetch_leaders(league)
+    if leaders is None:
+        return pd.DataFrame()
+
+    url = _leagues[league][0]
+    builders = _tables[league]
+    if category in builders:
+        return leader_table(leaders, category, builders[category], url)
+
+    found = leaders.get('index', {}).get(category)
+    if found is None:
+        return pd.DataFrame()
+    # Categories without a stats-module table are built once per snapshot too
+    return leader_table(leaders, category,
+                        lambda _: build_leaders_df(found['leaders'], found.get('abbreviation') or category), url)
+
+def get_season_type(league: str, allow_stale: bool = True) -> str:
+    """Return the season type (Regular Season, Postseason, etc.) published with a league's leaders."""
+    if league not in _leagues:
+        importlib.import_module(_STATS_MODULES[league])
+
+    leaders = fetch_leaders(league, allow_stale)
+    return leaders['season_type'] if leaders else "Season"
+
+def rank_leaders(columns: Dict[str, Sequence], stat_column_name: str, values: Sequence,
+                 display: Optional[Sequence[str]] = None, decimals: Optional[int] = None,
+                 strip_leading_zero: bool = False, lower_is_better: bool = False,
+                 blank_ties: bool = False) -> pd.DataFrame:
+    """
+    Rank leader rows by value and index them by display rank, without per-row callbacks.
+
+    Args:
+        columns: Leading display columns (e.g., Player, Team), one entry per leader
+        stat_column_name: Name of the stat column appended after columns
+        values: Ranking values (numbers or numeric strings); rows that don't
+            parse as numbers are dropped
+        display: Strings to show in the stat column; defaults to the values
+        decimals: Format the stat column from the numeric values with this many decimals
+        strip_leading_zero: Show 0.336 as .336 (with decimals)
+        lower_is_better: Rank ascending (ERA, GAA)
+        blank_ties: Show the rank only on the first tied row instead of "T" labels
+
+    Returns:
+        DataFrame sorted by rank with the display rank as its 'Rank' index
+    """
+    numeric = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+    valid = ~np.isnan(numeric)
+    numeric = numeric[valid]
+
+    # Min-rank: tied values share the best position, the next value skips ahead
+    ranks = pd.Series(numeric).rank(method='min', ascending=lower_is_better).to_numpy(dtype=int)
+    order = np.argsort(ranks, kind='stable')
+    ranks = ranks[order]
+
+    rank_labels = ranks.astype(str)
+    if blank_ties:
+        repeated = np.concatenate(([False], ranks[1:] == ranks[:-1]))
+        labels = np.where(repeated, '', rank_labels)
+    else:
+        tied = np.bincount(ranks)[ranks] > 1
+        labels = np.where(tied, np.char.add('T', rank_labels), rank_labels)
+
+    data = {name: np.asarray(column, dtype=object)[valid][order] for name, column in columns.items()}
+    if decimals is not None:
+        stat = np.char.mod(f'%.{decimals}f', numeric[order])
+        data[stat_column_name] = np.char.lstrip(stat, '0') if strip_leading_zero else stat
+    elif display is not None:
+        data[stat_column_name] = np.asarray(display, dtype=object)[valid][order]
+    else:
+        data[stat_column_name] = np.asarray(values, dtype=object)[valid][order].astype(str)
+
+    return pd.DataFrame(data, index=pd.Index(labels, name='Rank'))
+
+def build_leaders_df(leaders: List[Dict], stat_column_name: str, rank_by: str = 'displayValue',
+                     **options) -> pd.DataFrame:
+    """
+    Build a ranked leaders table from one v3 leaders category.
+
+    Args:
+        leaders: The category's 'leaders' list
+        stat_column_name: Column header for the stat (e.g., 'PPG')
+        rank_by: Leader field to rank on, 'displayValue' or 'value'
+        options: Passed on to rank_leaders (decimals, lower_is_better, ...)
+
+    Returns:
+        Ranked DataFrame, or an empty one if the category is missing or malformed
+    """
+    if not leaders:
+        return pd.DataFrame()
+
+    try:
+        columns = {
+            'Player': [leader['athlete']['displayName'] for leader in leaders],
+            'Team': [leader['team']['displayName'] for leader in leaders],
+        }
+        values = [leader[rank_by] for leader in leaders]
+        display = [leader['displayValue'] for leader in leaders]
+        return rank_leaders(columns, stat_column_name, values, display=display, **options)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error building DataFrame: {e}")
+        return pd.DataFrame()
+
@@ -0,0 +1,223 @@
+"""Concurrent loading of the data each sport page needs."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from cache import shared_cache, LEADERS_TTL, NEWS_TTL
+from espn_api import (LEADERS_URLS, fetch_mlb_scores, fetch_nba_scores, fetch_nhl_scores,
+                      fetch_nfl_scores, fetch_premier_league_scores, fetch_nhl_news, fetch_nba_news,
+                      fetch_nfl_news, fetch_premier_league_news, fetch_mlb_news)
+from score_changes import ChangeKind, GameChange, subscribe
+from snapshots import Snapshot, store
+
+# Bounded pool shared by every session in the server process
+MAX_WORKERS = 8
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="page-loader")
+
+# Scores load with the page; every other section loads when it's first opened
+EAGER_SECTIONS = ('scores',)
+
+# An opened section is kept warm by the poller for this long after its last read
+SECTION_KEEPALIVE = 15 * 60
+
+# Age after which an on-demand section's stored snapshot (possibly restored
+# from a previous process) is refreshed when it's read
+SECTION_MAX_AGE = {
+    'news': NEWS_TTL,
+    'season_type': LEADERS_TTL,
+}
+
+
+def _season_type(league: str) -> Callable[[], str]:
+    """
+    Season type fetch for a league.
+
+    leaders (and with it pandas and the league's stats module) is imported on
+    the first call, so pages that never open Statistics don't pay for it.
+    Loading the season type also fills the leaders cache, so the leader
+    tables build without a fetch.
+    """
+    def fetch(allow_stale: bool = True) -> str:
+        from leaders import get_season_type
+        return get_season_type(league, allow_stale)
+
+    return fetch
+
+
+# Independent fetches per sport page
+PAGE_FETCHES: Dict[str, Dict[str, Callable[[], Any]]] = {
+    "MLB": {
+        'scores': fetch_mlb_scores,
+        'news': fetch_mlb_news,
+        'season_type': _season_type("MLB"),
+    },
+    "NBA": {
+        'scores': fetch_nba_scores,
+        'news': fetch_nba_news,
+        'season_type': _season_type("NBA"),
+    },
+    "NFL": {
+        'scores': fetch_nfl_scores,
+        'news': fetch_nfl_news,
+        'season_type': _season_type("NFL"),
+    },
+    "NHL": {
+        'scores': fetch_nhl_scores,
+        'news': fetch_nhl_news,
+        'season_type': _season_type("NHL"),
+    },
+    "Premier League": {
+        'scores': fetch_premier_league_scores,
+        'news': fetch_premier_league_news,
+        'season_type': _season_type("Premier League"),
+    },
+}
+
+# (sport, section) -> time.monotonic() of the last read of an on-demand section
+_opened: Dict[Tuple[str, str], float] = {}
+
+# (sport, section) pairs with a background refresh in flight
+_refreshing: Set[Tuple[str, str]] = set()
+_refreshing_lock = threading.Lock()
+
+
+def _submit(sport: str, name: str) -> Future:
+    """
+    Start one page fetch on the executor.
+
+    Everything written to the store waits for an expired payload to be
+    refetched rather than taking the stale copy, so the store (and the
+    poller's schedule, which reads it) is never a poll behind the upstream.
+    """
+    return _executor.submit(PAGE_FETCHES[sport][name], allow_stale=False)
+
+
+def _store_results(futures: Dict[Tuple[str, str], Future]) -> None:
+    """Wait for fetches keyed by (sport, name) and store every non-None result."""
+    for (sport, name), future in futures.items():
+        try:
+            value = future.result()
+        except Exception as e:
+            print(f"Error loading {sport} {name}: {e}")
+            continue
+        if value is not None:
+            store.put((sport, name), value)
+
+
+def _refresh_in_background(sport: str, name: str) -> None:
+    """Refetch and store one section without waiting for it; at most one refresh per section runs."""
+    with _refreshing_lock:
+        if (sport, name) in _refreshing:
+            return
+        _refreshing.add((sport, name))
+
+    def stored(future: Future) -> None:
+        try:
+            _store_results({(sport, name): future})
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard((sport, name))
+
+    _submit(sport, name).add_done_callback(stored)
+
+
+def _warm_sections(sport: str) -> List[str]:
+    """The eager sections plus every section someone opened recently."""
+    cutoff = time.monotonic() - SECTION_KEEPALIVE
+    return [name for name in PAGE_FETCHES[sport]
+            if name in EAGER_SECTIONS or _opened.get((sport, name), float('-inf')) >= cutoff]
+
+
+def refresh_page_data(sport: str) -> None:
+    """
+    Run a sport page's warm fetches in parallel and store the results.
+
+    A fetch that fails or returns None leaves the previous snapshot in place.
+    """
+    _store_results({(sport, name): _submit(sport, name) for name in _warm_sections(sport)})
+
+
+def load_page_data(sport: str) -> Dict[str, Any]:
+    """
+    Read a sport page's eager sections from the snapshot store.
+
+    Args:
+        sport: Sport name as shown in the sidebar (e.g., 'NHL')
+
+    Returns:
+        Dict keyed by EAGER_SECTIONS; values missing from the store (before
+        the poller's first pass) are fetched inline, and anything still
+        unavailable maps to None
+    """
+    if any(store.get((sport, name)) is None for name in EAGER_SECTIONS):
+        refresh_page_data(sport)
+
+    results = {}
+    for name in EAGER_SECTIONS:
+        snapshot = store.get((sport, name))
+        results[name] = snapshot.value if snapshot else None
+    return results
+
+
+def load_section(sport: str, name: str) -> Any:
+    """
+    Read an on-demand section, fetching it the first time it's opened.
+
+    A stored snapshot older than the section's SECTION_MAX_AGE (e.g., one
+    restored from disk) is returned as is while it refreshes in the
+    background. Reading a section also keeps the poller refreshing it for
+    SECTION_KEEPALIVE.
+
+    Args:
+        sport: Sport name as shown in the sidebar (e.g., 'NHL')
+        name: Section key in PAGE_FETCHES[sport] (e.g., 'news')
+
+    Returns:
+        The stored value, or None if it could not be fetched
+    """
+    _opened[(sport, name)] = time.monotonic()
+
+    snapshot = store.get((sport, name))
+    if snapshot is None:
+        _store_results({(sport, name): _submit(sport, name)})
+        snapshot = store.get((sport, name))
+    elif time.time() - snapshot.fetched_at > SECTION_MAX_AGE.get(name, float('inf')):
+        _refresh_in_background(sport, name)
+
+    return snapshot.value if snapshot else None
+
+
+def page_snapshot(sport: str, name: str) -> Optional[Snapshot]:
+    """Return the stored snapshot (value plus version) of one page fetch."""
+    return store.get((sport, name))
+
+
+def load_scoreboards() -> Dict[str, Optional[Snapshot]]:
+    """
+    Read every league's scoreboard snapshot for the overview page.
+
+    Returns:
+        Snapshot (or None if unavailable) per sport, in PAGE_FETCHES order;
+        scoreboards missing from the store are fetched in parallel first
+    """
+    missing = [sport for sport in PAGE_FETCHES if store.get((sport, 'scores')) is None]
+    _store_results({(sport, 'scores'): _submit(sport, 'scores') for sport in missing})
+
+    return {sport: store.get((sport, 'scores')) for sport in PAGE_FETCHES}
+
+
+def _expire_leaders(league: str, changes: List[GameChange]) -> None:
+    """
+    Expire a league's cached leaders, in every process, once one of its games finishes.
+
+    Registered here rather than in leaders, which loads only when Statistics
+    is opened: whichever process refreshes the scoreboard sees the change.
+    """
+    if any(change.kind is ChangeKind.STATE and change.game.state == 'post' for change in changes):
+        shared_cache.expire(LEADERS_URLS[league])
+
+
+subscribe(_expire_leaders)
@@ -1,97 +1,55 @@
-import requests
 import pandas as pd
 
-url = "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/statistics"
-
-def get_pl_season_type():
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        season_type = data['season']['displayName']
-        return season_type
-    except Exception as e:
-        print(f"Error fetching Premier League season type: {e}")
-        return "Season"
+from espn_api import LEADERS_URLS
+from leaders import get_leaders, get_season_type, rank_leaders, register_league
+
+def _leader_columns(leaders, stat_index):
+    """Pull the displayed fields for a statistics category into columns plus stat values."""
+    columns = {
+        'Player': [leader['athlete']['displayName'] for leader in leaders],
+        'Team': [leader['athlete']['team']['displayName'] for leader in leaders],
+        'Matches Played': [leader['athlete']['statistics'][0]['displayValue'] for leader in leaders],
+    }
+    values = [leader['athlete']['statistics'][stat_index]['displayValue'] for leader in leaders]
+    return {'columns': columns, 'values': values}
+
+def _parse_statistics(data):
+    """Parse the statistics payload into the season type and the columns of each table."""
+    return {
+        'season_type': data['season']['displayName'],
+        'categories': {
+            'goals': _leader_columns(data['stats'][0]['leaders'], 1),
+            'assists': _leader_columns(data['stats'][1]['leaders'], 2),
+        },
+        # Filled on first use, once per snapshot
+        'tables': {},
+    }
+
+def _build_leaders_df(category, stat_column_name):
+    """Helper function to build a ranked DataFrame from a parsed category."""
+    if not category['values']:
+        return pd.DataFrame()
 
-def fetch_pl_goal_leaders():
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        goals_leaders = data['stats'][0]['leaders']
-        goals_df = pd.DataFrame({
-        'Player': leader['athlete']['displayName'],
-        'Team': leader['athlete']['team']['displayName'],
-        'Matches Played': leader['athlete']['statistics'][0]['displayValue'],
-        'Goals': leader['athlete']['statistics'][1]['displayValue'],
-        }
-        for leader in goals_leaders                        
-        )
-
-        # Add ranks to the data frame
-        goals_df['Goals'] = goals_df['Goals'].astype(int)
-        goals_df['Rank'] = goals_df['Goals'].rank(method='min', ascending=False).astype(int)
-
-        # Sort by rank
-        goals_df = goals_df.sort_values('Rank')
-
-        # Create display rank - show rank only for first occurrence of each rank
-        goals_df['Display_Rank'] = goals_df['Rank'].where(
-            goals_df['Rank'] != goals_df['Rank'].shift(),
-            ''
-        ).astype(str)
-
-        # Set Display_Rank as index
-        goals_df = goals_df.set_index('Display_Rank')
-        goals_df.index.name = 'Rank'
-
-        # Drop the original Rank column since it's now in the index
-        goals_df = goals_df.drop('Rank', axis=1)
-        goals_df['Goals'] = goals_df['Goals'].astype(str)
-        return goals_df
-    except Exception as e:
-        print(f"Error fetching Premier League goal leaders: {e}")
+        # Show the rank only on the first of each group of tied players
+        return rank_leaders(category['columns'], stat_column_name, category['values'],
+                            decimals=0, blank_ties=True)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error building DataFrame: {e}")
         return pd.DataFrame()
-    
-def fetch_pl_assist_leaders():
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        assist_leaders = data['stats'][1]['leaders']
-        assist_df = pd.DataFrame({
-        'Player': leader['athlete']['displayName'],
-        'Team': leader['athlete']['team']['displayName'],
-        'Matches Played': leader['athlete']['statistics'][0]['displayValue'],
-        'Assists': leader['athlete']['statistics'][2]['displayValue'],
-        }
-        for leader in assist_leaders                        
-        )
-
-        # Add ranks to the data frame
-        assist_df['Assists'] = assist_df['Assists'].astype(int)
-        assist_df['Rank'] = assist_df['Assists'].rank(method='min', ascending=False).astype(int)
 
-        # Sort by rank
-        assist_df = assist_df.sort_values('Rank')
+_PL_TABLES = {
+    'goals': lambda statistics: _build_leaders_df(statistics['categories']['goals'], 'Goals'),
+    'assists': lambda statistics: _build_leaders_df(statistics['categories']['assists'], 'Assists'),
+}
 
-        # Create display rank - show rank only for first occurrence of each rank
-        assist_df['Display_Rank'] = assist_df['Rank'].where(
-            assist_df['Rank'] != assist_df['Rank'].shift(),
-            ''
-        ).astype(str)
+register_league("Premier League", LEADERS_URLS["Premier League"], _parse_statistics, tables=_PL_TABLES)
 
-        # Set Display_Rank as index
-        assist_df = assist_df.set_index('Display_Rank')
-        assist_df.index.name = 'Rank'
+def get_pl_season_type():
+    return get_season_type("Premier League")
 
-        # Drop the original Rank column since it's now in the index
-        assist_df = assist_df.drop('Rank', axis=1)
-        assist_df['Assists'] = assist_df['Assists'].astype(str)
+def fetch_pl_goal_leaders():
+    return get_leaders("Premier League", 'goals')
 
-        return assist_df
-    except Exception as e:
-        print(f"Error fetching Premier League assist leaders: {e}")
-        return pd.DataFrame()
-        
\ No newline at end of file
+def fetch_pl_assist_leaders():
+    return get_leaders("Premier League", 'assists')
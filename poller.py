@@ -0,0 +1,87 @@
+"""Background thread that keeps the snapshot store warm."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Sequence
+
+from espn_api import GameRecord
+from page_loader import PAGE_FETCHES, refresh_page_data
+from snapshots import store
+
+# Per-league refresh cadence in seconds, chosen from the league's scoreboard
+LIVE_POLL_INTERVAL = 10          # any game in progress
+PREGAME_POLL_INTERVAL = 60       # a start time has arrived but the game isn't live yet
+IDLE_POLL_INTERVAL = 60 * 60     # every game final, or nothing scheduled
+PREGAME_LEAD = 5 * 60            # wake this long before the next start time
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def next_poll_delay(games: Sequence[GameRecord], now: Optional[datetime] = None) -> float:
+    """
+    Seconds to wait before refreshing a league again.
+
+    Args:
+        games: The league's scoreboard as GameRecords
+        now: Current UTC time (defaults to datetime.now(timezone.utc))
+
+    Returns:
+        LIVE_POLL_INTERVAL while any game is in progress, otherwise the time
+        until shortly before the next scheduled start, capped at IDLE_POLL_INTERVAL
+    """
+    if any(game.state == 'in' for game in games):
+        return LIVE_POLL_INTERVAL
+
+    now = now or datetime.now(timezone.utc)
+    starts = [datetime.fromisoformat(game.date.replace('Z', '+00:00'))
+              for game in games if game.state == 'pre']
+    if not starts:
+        return IDLE_POLL_INTERVAL
+
+    until_start = (min(starts) - now).total_seconds() - PREGAME_LEAD
+    if until_start <= 0:
+        return PREGAME_POLL_INTERVAL
+    return min(until_start, IDLE_POLL_INTERVAL)
+
+
+def _league_delay(sport: str) -> float:
+    snapshot = store.get((sport, 'scores'))
+    if snapshot is None:
+        # Nothing stored yet (fetch failed); try again soon
+        return PREGAME_POLL_INTERVAL
+
+    try:
+        return next_poll_delay(snapshot.value)
+    except ValueError as e:
+        print(f"Error scheduling {sport} refresh: {e}")
+        return PREGAME_POLL_INTERVAL
+
+
+def _run() -> None:
+    next_due: Dict[str, float] = {sport: 0.0 for sport in PAGE_FETCHES}
+
+    while True:
+        for sport, due in next_due.items():
+            if due > time.monotonic():
+                continue
+            try:
+                refresh_page_data(sport)
+            except Exception as e:
+                print(f"Error refreshing {sport}: {e}")
+            next_due[sport] = time.monotonic() + _league_delay(sport)
+
+        time.sleep(max(0.0, min(next_due.values()) - time.monotonic()))
+
+
+def start_poller() -> None:
+    """Start the refresh thread once per server process; later calls are no-ops."""
+    global _started
+
+    with _start_lock:
+        if _started:
+            return
+        thread = threading.Thread(target=_run, name="espn-poller", daemon=True)
+        thread.start()
+        _started = True
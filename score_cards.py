@@ -0,0 +1,106 @@
+"""Formatted score cards, cached per scoreboard snapshot and timezone for every session."""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+from cache import TTLCache
+from espn_api import GameRecord
+from formatters import format_game_times, local_today
+from snapshots import Snapshot
+
+# (Streamlit element, text): 'info' for upcoming, 'success' for live, 'write' for final
+Card = Tuple[str, str]
+
+# Cards for superseded snapshots simply age out
+CARDS_TTL = 15 * 60
+
+render_cache = TTLCache(max_entries=512)
+
+# Overview order: live games first, then upcoming, then finals
+_STATE_ORDER = {'in': 0, 'pre': 1, 'post': 2}
+
+
+def _game_card(game: GameRecord, sport_code: str, game_time: Optional[str]) -> Card:
+    """Format one game; game_time is its local start time when it hasn't started."""
+    if game.state == 'pre':
+        broadcast_text = f"\n\nWatch: {game.broadcast}" if game.broadcast else ""
+        if sport_code != 'eng.1':
+            return ('info', f"{game.away_team} @ {game.home_team} - {game_time}\n\n"
+                            f"Odds: {game.odds}\n\n{broadcast_text}")
+        return ('info', f"{game.home_team} vs {game.away_team} - {game_time}\n\n{broadcast_text}")
+
+    if game.state == 'in':
+        broadcast_text = f"\n\nWatch: {game.broadcast}" if game.broadcast else ""
+        if sport_code != 'eng.1':
+            return ('success', f"{game.away_team} {game.away_score} @ "
+                               f"{game.home_team} {game.home_score}\n\n"
+                               f"{game.game_status}\n\n{broadcast_text}")
+        return ('success', f"{game.home_team} {game.home_score} vs "
+                           f"{game.away_score} {game.away_team}\n\n"
+                           f"{game.game_status}\n\n{broadcast_text}")
+
+    if sport_code != 'eng.1':
+        return ('write', f"{game.away_team} {game.away_score} @ "
+                         f"{game.home_team} {game.home_score} - {game.game_status}")
+    return ('write', f"{game.home_team} {game.home_score} - "
+                     f"{game.away_score} {game.away_team} - {game.game_status}")
+
+
+def _start_times(games: Sequence[GameRecord], timezone: str) -> Dict[str, str]:
+    """Format every upcoming start time in one batch, keyed by the UTC string."""
+    pre_dates = [game.date for game in games if game.state == 'pre']
+    return dict(zip(pre_dates, format_game_times(pre_dates, timezone)))
+
+
+def build_score_cards(games: Sequence[GameRecord], sport_code: str, timezone: str) -> Tuple[Card, ...]:
+    """Format every game of a scoreboard into the card shown for it."""
+    game_times = _start_times(games, timezone)
+    return tuple(_game_card(game, sport_code, game_times.get(game.date)) for game in games)
+
+
+def build_overview_cards(scoreboards: Dict[str, Sequence[GameRecord]],
+                         timezone: str) -> Tuple[Tuple[str, Card], ...]:
+    """
+    Combine several leagues' scoreboards into one slate.
+
+    Args:
+        scoreboards: GameRecords per sport name
+        timezone: Timezone string for start times
+
+    Returns:
+        (sport, card) pairs ordered live, upcoming, final, then by start time
+    """
+    slate = [(sport, game) for sport, games in scoreboards.items() for game in games]
+    slate.sort(key=lambda item: (_STATE_ORDER.get(item[1].state, len(_STATE_ORDER)), item[1].date))
+
+    game_times = _start_times([game for _, game in slate], timezone)
+    return tuple((sport, _game_card(game, game.sport, game_times.get(game.date))) for sport, game in slate)
+
+
+def get_score_cards(sport: str, snapshot: Snapshot, sport_code: str, timezone: str) -> Tuple[Card, ...]:
+    """
+    Return the cards for a scoreboard snapshot, building them once per version and timezone.
+
+    Args:
+        sport: Sport name as shown in the sidebar (e.g., 'NHL')
+        snapshot: The sport's stored scoreboard snapshot
+        sport_code: ESPN sport code ('eng.1' switches to home-first soccer cards)
+        timezone: Timezone string for start times
+
+    Returns:
+        Tuple of (Streamlit element, text) pairs, shared across sessions
+    """
+    # Start times read "3:00 PM" today and "Oct 19, 3:00 PM" otherwise, so the
+    # local date is part of the key
+    key = (sport, snapshot.version, timezone, local_today(timezone))
+    return render_cache.get_or_load(key, lambda: build_score_cards(snapshot.value, sport_code, timezone),
+                                    ttl=CARDS_TTL)
+
+
+def get_overview_cards(snapshots: Dict[str, Snapshot], timezone: str) -> Tuple[Tuple[str, Card], ...]:
+    """Return the combined slate for a set of scoreboard snapshots, built once per set of versions."""
+    versions = tuple((sport, snapshot.version) for sport, snapshot in snapshots.items())
+    key = ('overview', versions, timezone, local_today(timezone))
+    return render_cache.get_or_load(
+        key,
+        lambda: build_overview_cards({sport: snapshot.value for sport, snapshot in snapshots.items()}, timezone),
+        ttl=CARDS_TTL)
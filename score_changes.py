@@ -0,0 +1,93 @@
+"""Typed change events between successive scoreboards of each league."""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from espn_api import GameRecord
+
+
+class ChangeKind(Enum):
+    SCORE = "score"        # either team's score changed
+    CLOCK = "clock"        # period or game clock moved
+    STATE = "state"        # pre -> in -> post
+    ODDS = "odds"          # betting line moved
+
+
+@dataclass(frozen=True, slots=True)
+class GameChange:
+    """One change to one game between two scoreboards."""
+    kind: ChangeKind
+    league: str
+    previous: "GameRecord"
+    game: "GameRecord"
+
+
+# Listeners called with (league, changes) whenever a league's scoreboard changes
+_listeners: List[Callable[[str, List[GameChange]], None]] = []
+
+
+def diff_scoreboards(previous: Sequence["GameRecord"], current: Sequence["GameRecord"],
+                     league: str) -> List[GameChange]:
+    """
+    Compare two scoreboards of one league game by game.
+
+    Games are matched by ESPN event id; games that appear or disappear
+    (e.g., when the slate rolls over to a new day) produce no events.
+
+    Returns:
+        Change events in scoreboard order; unchanged games cost one comparison
+    """
+    previous_by_id = {game.id: game for game in previous}
+
+    changes = []
+    for game in current:
+        old = previous_by_id.get(game.id)
+        if old is None or old == game:
+            continue
+        if old.home_score != game.home_score or old.away_score != game.away_score:
+            changes.append(GameChange(ChangeKind.SCORE, league, old, game))
+        if old.period != game.period or old.clock != game.clock:
+            changes.append(GameChange(ChangeKind.CLOCK, league, old, game))
+        if old.state != game.state:
+            changes.append(GameChange(ChangeKind.STATE, league, old, game))
+        if old.odds != game.odds:
+            changes.append(GameChange(ChangeKind.ODDS, league, old, game))
+    return changes
+
+
+def subscribe(listener: Callable[[str, List[GameChange]], None]) -> None:
+    """Register a function called with (league, changes) for every scoreboard that changed."""
+    _listeners.append(listener)
+
+
+def publish_scoreboard(league: str, previous: Optional[Tuple["GameRecord", ...]],
+                       games: Tuple["GameRecord", ...]) -> Tuple["GameRecord", ...]:
+    """
+    Notify listeners of what changed between a league's last and newest scoreboard.
+
+    Args:
+        league: League name passed to listeners
+        previous: Scoreboard currently in the shared cache, or None
+        games: Newly fetched scoreboard
+
+    Returns:
+        previous if nothing in it changed, so callers keep handing out the
+        same object (and the same snapshot version); otherwise games
+    """
+    if previous is games or previous == games:
+        return previous
+
+    # The first scoreboard seen only sets the baseline
+    if previous is None:
+        return games
+
+    changes = diff_scoreboards(previous, games, league)
+    if changes:
+        for listener in _listeners:
+            try:
+                listener(league, changes)
+            except Exception as e:
+                print(f"Error handling {league} scoreboard changes: {e}")
+    return games
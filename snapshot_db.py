@@ -0,0 +1,117 @@
+"""SQLite file that keeps the snapshot store across restarts (and holds the shared cache)."""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+# Where snapshots are kept; set SPORTS_SCORES_DB to "" to keep them in memory only
+DB_PATH = os.environ.get(
+    "SPORTS_SCORES_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "sports_scores.sqlite3"),
+)
+
+# Seconds a writer waits for another process's write lock before giving up
+BUSY_TIMEOUT = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open the database in WAL mode so readers never block the writer."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                                 isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # WAL plus NORMAL survives a crash of the process; only an OS crash can
+    # lose the last few commits, which the poller refetches anyway
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def encode_value(value: Any) -> Tuple[str, str]:
+    """
+    Serialize a snapshot value to (kind, JSON text).
+
+    Scoreboards are stored as lists of GameRecord fields. Leaders payloads
+    are stored without their 'tables', which are rebuilt on first use.
+    """
+    # espn_api imports the cache, which stores through this module
+    from espn_api import GameRecord
+
+    if isinstance(value, tuple) and all(isinstance(game, GameRecord) for game in value):
+        return 'games', json.dumps([asdict(game) for game in value])
+    if isinstance(value, dict) and 'tables' in value:
+        value = {**value, 'tables': {}}
+    return 'json', json.dumps(value)
+
+
+def decode_value(kind: str, text: str) -> Any:
+    """Inverse of encode_value."""
+    data = json.loads(text)
+    if kind == 'games':
+        from espn_api import GameRecord
+        return tuple(GameRecord(**fields) for fields in data)
+    return data
+
+
+def encode_key(key: Hashable) -> str:
+    return json.dumps(list(key) if isinstance(key, tuple) else key)
+
+
+def decode_key(text: str) -> Hashable:
+    key = json.loads(text)
+    return tuple(key) if isinstance(key, list) else key
+
+
+class SnapshotDB:
+    """Write-through persistence for SnapshotStore, one row per key."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = connect(path)
+        self._connection.execute(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def save(self, key: Hashable, value: Any, version: int, fetched_at: float) -> None:
+        kind, text = encode_value(value)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO snapshots (key, kind, value, version, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (encode_key(key), kind, text, version, fetched_at))
+
+    def load(self) -> Iterator[Tuple[Hashable, Any, int, float]]:
+        """Yield (key, value, version, fetched_at) for every stored snapshot."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, kind, value, version, fetched_at FROM snapshots").fetchall()
+
+        for key, kind, text, version, fetched_at in rows:
+            try:
+                yield decode_key(key), decode_value(kind, text), version, fetched_at
+            except (TypeError, ValueError) as e:
+                print(f"Error restoring snapshot {key}: {e}")
+
+
+def open_snapshot_db(path: str = DB_PATH) -> Optional[SnapshotDB]:
+    """Open the snapshot file, or return None if persistence is off or unavailable."""
+    if not path:
+        return None
+    try:
+        return SnapshotDB(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error opening snapshot database {path}: {e}")
+        return None
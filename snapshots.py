@@ -0,0 +1,86 @@
+"""Shared store of the latest data snapshot for every page fetch."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Hashable, Optional
+
+from snapshot_db import SnapshotDB, open_snapshot_db
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One stored value plus its version and the time it was last fetched (or confirmed unchanged)."""
+    value: Any
+    version: int
+    fetched_at: float
+
+
+class SnapshotStore:
+    """
+    Thread-safe map of key -> latest Snapshot, shared by every session.
+
+    With a SnapshotDB every stored snapshot is also written to disk, and
+    restore() brings them back in a new process.
+    """
+
+    def __init__(self, db: Optional[SnapshotDB] = None):
+        self._snapshots: Dict[Hashable, Snapshot] = {}
+        self._lock = threading.Lock()
+        self._db = db
+
+    def restore(self) -> int:
+        """
+        Load every persisted snapshot that isn't already in memory.
+
+        Returns:
+            Number of snapshots restored
+        """
+        if self._db is None:
+            return 0
+
+        restored = 0
+        try:
+            for key, value, version, fetched_at in self._db.load():
+                with self._lock:
+                    if key not in self._snapshots:
+                        self._snapshots[key] = Snapshot(value=value, version=version, fetched_at=fetched_at)
+                        restored += 1
+        except sqlite3.Error as e:
+            print(f"Error restoring snapshots: {e}")
+        return restored
+
+    def get(self, key: Hashable) -> Optional[Snapshot]:
+        return self._snapshots.get(key)
+
+    def put(self, key: Hashable, value: Any) -> Snapshot:
+        """
+        Store a freshly fetched value.
+
+        The version only moves when a different object is stored; the cached
+        fetchers hand back the same object until their TTL expires (and after
+        a 304 or an unchanged body), so re-storing it leaves the version alone
+        and only moves fetched_at, in memory.
+        """
+        with self._lock:
+            current = self._snapshots.get(key)
+            if current is not None and current.value is value:
+                current = replace(current, fetched_at=time.time())
+                self._snapshots[key] = current
+                return current
+            version = current.version + 1 if current else 1
+            snapshot = Snapshot(value=value, version=version, fetched_at=time.time())
+            self._snapshots[key] = snapshot
+
+            if self._db is not None:
+                try:
+                    self._db.save(key, value, version, snapshot.fetched_at)
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    print(f"Error persisting snapshot {key}: {e}")
+            return snapshot
+
+
+# One store per server process, served from disk until the first refresh
+store = SnapshotStore(open_snapshot_db())
+store.restore()